@@ -8,7 +8,7 @@
 #
 import numpy as np
 from itertools import combinations
-from .points import Point, dot, get_unit_normal, is_point_inside_triangle
+from .points import ORIGIN, dot, get_unit_normal, is_point_inside_triangle
 
 
 def get_legs_on_ground(legs):
@@ -119,5 +119,4 @@ def set_of_two_trios_from_six():
 # is inside projection (in the xy plane) of
 # the triangle defined by point a, b, c, then this is stable
 def check_stability(a, b, c):
-    p = Point(0, 0, 0)
-    return is_point_inside_triangle(p, a, b, c)
+    return is_point_inside_triangle(ORIGIN, a, b, c)
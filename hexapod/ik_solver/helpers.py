@@ -7,7 +7,13 @@ from settings import (
 )
 import json
 import numpy as np
-from hexapod.points import length, vector_from_to, angle_between
+from hexapod.points import (
+    Point,
+    length,
+    vector_from_to,
+    angle_between,
+    do_nothing,
+)
 
 COXIA_ON_GROUND_ALERT_MSG = "Impossible at given height.\ncoxia joint shoved on ground"
 BODY_ON_GROUND_ALERT_MSG = "Impossible at given height.\nbody contact shoved on ground"
@@ -26,12 +32,9 @@ def cant_reach_alert_msg(leg_name, problem):
 
 
 def body_contact_shoved_on_ground(hexapod):
-    for i in range(hexapod.LEG_COUNT):
-        body_contact = hexapod.body.vertices[i]
-        foot_tip = hexapod.legs[i].foot_tip()
-        if body_contact.z < foot_tip.z:
-            return True
-    return False
+    body_contacts_z = np.array([vertex.z for vertex in hexapod.body.vertices])
+    foot_tips_z = hexapod.leg_points[:, 3, 2]
+    return (body_contacts_z < foot_tips_z).any()
 
 
 def legs_too_short(legs):
@@ -52,7 +55,7 @@ def legs_too_short(legs):
 
 
 def angle_above_limit(angle, angle_range, leg_name, angle_name):
-    if np.abs(angle) > angle_range:
+    if abs(angle) > angle_range:
         alert_msg = f"The {angle_name} (of {leg_name} leg) required\n\
             to do this pose is beyond the range of motion.\n\
             Required: {angle} degrees. Limit: {angle_range} degrees."
@@ -62,6 +65,9 @@ def angle_above_limit(angle, angle_range, leg_name, angle_name):
 
 
 def beta_gamma_not_in_range(beta, gamma, leg_name):
+    if abs(beta) <= BETA_MAX_ANGLE and abs(gamma) <= GAMMA_MAX_ANGLE:
+        return False, None
+
     limit, msg = angle_above_limit(beta, BETA_MAX_ANGLE, leg_name, "(beta/femur)")
     if limit:
         return True, msg
@@ -77,10 +83,7 @@ def wrong_length_msg(leg_name, limb_name, limb_value):
     return f"wrong {limb_name} vector length. {leg_name} coxia:{limb_value}"
 
 
-def might_sanity_leg_lengths_check(hexapod, leg_name, points):
-    if not ASSERTION_ENABLED:
-        return
-
+def sanity_leg_lengths_check(hexapod, leg_name, points):
     coxia = length(vector_from_to(points[0], points[1]))
     femur = length(vector_from_to(points[1], points[2]))
     tibia = length(vector_from_to(points[2], points[3]))
@@ -95,10 +98,7 @@ def might_sanity_leg_lengths_check(hexapod, leg_name, points):
     assert same_length, wrong_length_msg(leg_name, "tibia", tibia)
 
 
-def might_sanity_beta_gamma_check(beta, gamma, leg_name, points):
-    if not ASSERTION_ENABLED:
-        return
-
+def sanity_beta_gamma_check(beta, gamma, leg_name, points):
     coxia = vector_from_to(points[0], points[1])
     femur = vector_from_to(points[1], points[2])
     tibia = vector_from_to(points[2], points[3])
@@ -117,10 +117,7 @@ def might_sanity_beta_gamma_check(beta, gamma, leg_name, points):
         print(alert_msg)
 
 
-def might_print_ik(poses, ik_parameters, hexapod):
-    if not PRINT_IK:
-        return
-
+def print_ik(poses, ik_parameters, hexapod):
     print("█████████████████████████████")
     print("█ START INVERSE KINEMATICS  █")
     print("█████████████████████████████")
@@ -145,9 +142,10 @@ def might_print_ik(poses, ik_parameters, hexapod):
     print("█████████████████████████████")
 
 
-def might_print_points(points, leg_name):
-    if not PRINT_IK_LOCAL_LEG:
-        return
+def print_points(points, leg_name):
+    # The batched solver passes the rows of its (4, 3) array of leg points
+    if isinstance(points, np.ndarray):
+        points = [Point(*point) for point in points.tolist()]
 
     print()
     print(leg_name, "leg")
@@ -156,3 +154,13 @@ def might_print_points(points, leg_name):
     print(f"...p2: {points[2]}")
     print(f"...p3: {points[3]}")
     print()
+
+
+might_sanity_leg_lengths_check = (
+    sanity_leg_lengths_check if ASSERTION_ENABLED else do_nothing
+)
+might_sanity_beta_gamma_check = (
+    sanity_beta_gamma_check if ASSERTION_ENABLED else do_nothing
+)
+might_print_ik = print_ik if PRINT_IK else do_nothing
+might_print_points = print_points if PRINT_IK_LOCAL_LEG else do_nothing
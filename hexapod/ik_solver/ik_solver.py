@@ -1,14 +1,17 @@
 # Please look at the discussion of the Inverse Kinematics algorithm
 # As detailed in the README of this directory
 
-from settings import ASSERTION_ENABLED, ALPHA_MAX_ANGLE
+from settings import (
+    ASSERTION_ENABLED,
+    ALPHA_MAX_ANGLE,
+    BETA_MAX_ANGLE,
+    GAMMA_MAX_ANGLE,
+)
 import numpy as np
-from copy import deepcopy
 from hexapod.ik_solver.helpers import (
     BODY_ON_GROUND_ALERT_MSG,
     COXIA_ON_GROUND_ALERT_MSG,
     cant_reach_alert_msg,
-    body_contact_shoved_on_ground,
     legs_too_short,
     beta_gamma_not_in_range,
     angle_above_limit,
@@ -17,24 +20,17 @@ from hexapod.ik_solver.helpers import (
     might_print_ik,
     might_print_points,
 )
-from hexapod.const import HEXAPOD_POSE
-from hexapod.points import (
-    Point,
-    length,
-    add_vectors,
-    scalar_multiply,
-    vector_from_to,
-    get_unit_vector,
-    is_triangle,
-    project_vector_onto_plane,
-    angle_between,
-    angle_opposite_of_last_side,
-)
-from hexapod.ik_solver.shared import (
-    update_hexapod_points,
-    find_twist_frame,
-    compute_twist_wrt_to_world,
-)
+from hexapod.ik_solver.shared import detach_ground_contacts
+from hexapod.points import points_to_array
+
+# Status of each leg as found by solve_legs()
+LEG_OK = 0
+COXIA_ON_GROUND = 1
+BLOCKED_BY_GROUND = 2
+FEMUR_TOO_LONG = 3
+TIBIA_TOO_LONG = 4
+BETA_GAMMA_OUT_OF_RANGE = 5
+ALPHA_OUT_OF_RANGE = 6
 
 
 # This function computes the joint angles required to
@@ -53,160 +49,271 @@ from hexapod.ik_solver.shared import (
 # hexapod whose body is detached from its legs, the body having the pose required
 # an ALERT message will also be returned explaining why the pose is impossible
 #
-poses = deepcopy(HEXAPOD_POSE)
-
-
 def inverse_kinematics_update(hexapod, ik_parameters):
 
     tx = ik_parameters["percent_x"] * hexapod.mid
     ty = ik_parameters["percent_y"] * hexapod.side
     tz = ik_parameters["percent_z"] * hexapod.tibia
-    rotx, roty, rotz = (
+    rot_x, rot_y, rot_z = (
         ik_parameters["rot_x"],
         ik_parameters["rot_y"],
         ik_parameters["rot_z"],
     )
 
     hexapod.update_stance(ik_parameters["hip_stance"], ik_parameters["leg_stance"])
-    hexapod.detach_body_rotate_and_translate(rotx, roty, rotz, tx, ty, tz)
+    hexapod.detach_body_rotate_and_translate(rot_x, rot_y, rot_z, tx, ty, tz)
+    detach_ground_contacts(hexapod)
+
+    # Each row of these arrays corresponds to one leg
+    body_contacts = points_to_array(hexapod.body.vertices)
+    foot_tips = hexapod.leg_points[:, 3].copy()
 
-    if body_contact_shoved_on_ground(hexapod):
+    if (body_contacts[:, 2] < foot_tips[:, 2]).any():
         raise Exception(BODY_ON_GROUND_ALERT_MSG)
 
-    x_axis = Point(1, 0, 0)
+    x_axis, z_axis = hexapod.x_axis, hexapod.z_axis
+    x_axis = np.array([x_axis.x, x_axis.y, x_axis.z])
+    z_axis = np.array([z_axis.x, z_axis.y, z_axis.z])
+    coxia_axes = hexapod.body.COXIA_AXES_ARRAY
+    leg_points, angles, twists, statuses, stretched = solve_legs(
+        body_contacts,
+        foot_tips,
+        coxia_axes,
+        x_axis,
+        z_axis,
+        hexapod.coxia,
+        hexapod.femur,
+        hexapod.tibia,
+    )
+
+    if statuses.any() or stretched.any():
+        might_raise_leg_alert(hexapod, angles, statuses, stretched)
+
+    if ASSERTION_ENABLED:
+        assert hexapod.body_rotation_frame is not None, "No rotation frame!"
+
+    # Convert points from local leg coordinate frame to world coordinate frame
+    # and update hexapod's points to what we computed
+    hexapod.leg_points[:] = leg_points_wrt_world(
+        leg_points, twists, hexapod.body_rotation_frame, body_contacts
+    )
+
+    legs = hexapod.legs
+    poses = {}
+    for i, (alpha, beta, gamma) in enumerate(angles.tolist()):
+        leg_name = legs[i].name
+        might_print_points(leg_points[i], leg_name)
+
+        points = legs[i].all_points
+        might_sanity_leg_lengths_check(hexapod, leg_name, points)
+        might_sanity_beta_gamma_check(beta, gamma, leg_name, points)
+
+        # Finally update the pose
+        poses[i] = {
+            "name": leg_name,
+            "id": i,
+            "coxia": alpha,
+            "femur": beta,
+            "tibia": gamma,
+        }
+
+    might_print_ik(poses, ik_parameters, hexapod)
+    return poses, hexapod
+
+
+# Raises the alert of the first leg (in order) that can't do the pose
+# The legs that can't reach their target ground contact point
+# are stretched towards it, which is fine unless too many of them are
+def might_raise_leg_alert(hexapod, angles, statuses, stretched):
+    legs = hexapod.legs
     legs_up_in_the_air = []
 
-    for i in range(hexapod.LEG_COUNT):
-        leg_name = hexapod.legs[i].name
-        body_contact = hexapod.body.vertices[i]
-        foot_tip = hexapod.legs[i].foot_tip()
-        body_to_foot_vector = vector_from_to(body_contact, foot_tip)
-
-        # find the coxia vector which is the vector
-        # from body contact point to joint between coxia and femur limb
-        projection = project_vector_onto_plane(body_to_foot_vector, hexapod.z_axis)
-        unit_coxia_vector = get_unit_vector(projection)
-        coxia_vector = scalar_multiply(unit_coxia_vector, hexapod.coxia)
-
-        # coxia point / joint is the point connecting the coxia and tibia limbs
-        coxia_point = add_vectors(body_contact, coxia_vector)
-        if coxia_point.z < foot_tip.z:
-            raise Exception(COXIA_ON_GROUND_ALERT_MSG)
+    for i, (alpha, beta, gamma) in enumerate(angles.tolist()):
+        leg_name = legs[i].name
+        status = statuses[i]
 
-        # *******************
-        # 1. Compute p0, p1 and (possible) p3 wrt leg frame
-        # *******************
-        p0 = Point(0, 0, 0)
-        p1 = Point(hexapod.coxia, 0, 0)
-
-        # Find p3 aka foot tip (ground contact) with respect to the local leg frame
-        rho = angle_between(unit_coxia_vector, body_to_foot_vector)
-        body_to_foot_length = length(body_to_foot_vector)
-        p3x = body_to_foot_length * np.cos(np.radians(rho))
-        p3z = -body_to_foot_length * np.sin(np.radians(rho))
-        p3 = Point(p3x, 0, p3z)
-
-        # *******************
-        # 2. Compute p2, beta, gamma and final p3 wrt leg frame
-        # *******************
-
-        # These values are needed to compute
-        # p2 aka tibia joint (point between femur limb and tibia limb)
-        coxia_to_foot_vector2d = vector_from_to(p1, p3)
-        d = length(coxia_to_foot_vector2d)
-
-        # If we can form this triangle this means we probably can reach the target ground contact point
-        if is_triangle(hexapod.tibia, hexapod.femur, d):
-            # .................................
-            # CASE A: a triangle can be formed with
-            # coxia to foot vector, hexapod's femur and tibia
-            # .................................
-            theta = angle_opposite_of_last_side(d, hexapod.femur, hexapod.tibia)
-            phi = angle_between(coxia_to_foot_vector2d, x_axis)
-
-            beta = theta - phi  # case 1 or 2
-            if p3.z > 0:  # case 3
-                beta = theta + phi
-
-            z_ = hexapod.femur * np.sin(np.radians(beta))
-            x_ = p1.x + hexapod.femur * np.cos(np.radians(beta))
-
-            p2 = Point(x_, 0, z_)
-            femur_vector = vector_from_to(p1, p2)
-            tibia_vector = vector_from_to(p2, p3)
-            gamma = 90 - angle_between(femur_vector, tibia_vector)
-
-            if p2.z < p3.z:
-                raise Exception(cant_reach_alert_msg(leg_name, "blocking"))
-        else:
-            # .................................
-            # CASE B: It's impossible to reach target ground point
-            # .................................
-            if d + hexapod.tibia < hexapod.femur:
-                raise Exception(cant_reach_alert_msg(leg_name, "femur"))
-            if d + hexapod.femur < hexapod.tibia:
-                raise Exception(cant_reach_alert_msg(leg_name, "tibia"))
-
-            # Then hexapod.femur + hexapod.tibia < d:
+        if status == COXIA_ON_GROUND:
+            raise Exception(COXIA_ON_GROUND_ALERT_MSG)
+        if status == BLOCKED_BY_GROUND:
+            raise Exception(cant_reach_alert_msg(leg_name, "blocking"))
+        if status == FEMUR_TOO_LONG:
+            raise Exception(cant_reach_alert_msg(leg_name, "femur"))
+        if status == TIBIA_TOO_LONG:
+            raise Exception(cant_reach_alert_msg(leg_name, "tibia"))
+
+        if stretched[i]:
             legs_up_in_the_air.append(leg_name)
             LEGS_TOO_SHORT, alert_msg = legs_too_short(legs_up_in_the_air)
             if LEGS_TOO_SHORT:
                 raise Exception(alert_msg)
 
-            femur_tibia_direction = get_unit_vector(coxia_to_foot_vector2d)
-            femur_vector = scalar_multiply(femur_tibia_direction, hexapod.femur)
-            p2 = add_vectors(p1, femur_vector)
-            tibia_vector = scalar_multiply(femur_tibia_direction, hexapod.tibia)
-            p3 = add_vectors(p2, tibia_vector)
-
-            # Find beta and gamma
-            gamma = 0.0
-            leg_x_axis = Point(1, 0, 0)
-            beta = angle_between(leg_x_axis, femur_vector)
-            if femur_vector.z < 0:
-                beta = -beta
-
-        # Final p1, p2, p3, beta and gamma computed at this point
-        not_within_range, alert_msg = beta_gamma_not_in_range(beta, gamma, leg_name)
-        if not_within_range:
+        if status == BETA_GAMMA_OUT_OF_RANGE:
+            _, alert_msg = beta_gamma_not_in_range(beta, gamma, leg_name)
             raise Exception(alert_msg)
-
-        # *******************
-        # 3. Compute alpha and twist_frame
-        # Find frame used to twist the leg frame wrt to hexapod's body contact point's x axis
-        # *******************
-        alpha, twist_frame = find_twist_frame(hexapod, unit_coxia_vector)
-        alpha = compute_twist_wrt_to_world(alpha, hexapod.body.COXIA_AXES[i])
-        alpha_limit, alert_msg = angle_above_limit(
-            alpha, ALPHA_MAX_ANGLE, leg_name, "(alpha/coxia)"
-        )
-
-        if alpha_limit:
+        if status == ALPHA_OUT_OF_RANGE:
+            _, alert_msg = angle_above_limit(
+                alpha, ALPHA_MAX_ANGLE, leg_name, "(alpha/coxia)"
+            )
             raise Exception(alert_msg)
 
-        # *******************
-        # 4. Update hexapod points and finally update the pose
-        # *******************
-        points = [p0, p1, p2, p3]
-        might_print_points(points, leg_name)
-
-        # Convert points from local leg coordinate frame to world coordinate frame
-        for point in points:
-            point.update_point_wrt(twist_frame)
-            if ASSERTION_ENABLED:
-                assert hexapod.body_rotation_frame is not None, "No rotation frame!"
-            point.update_point_wrt(hexapod.body_rotation_frame)
-            point.move_xyz(body_contact.x, body_contact.y, body_contact.z)
-
-        might_sanity_leg_lengths_check(hexapod, leg_name, points)
-        might_sanity_beta_gamma_check(beta, gamma, leg_name, points)
-
-        # Update hexapod's points to what we computed
-        update_hexapod_points(hexapod, i, points)
 
-        poses[i]["coxia"] = alpha
-        poses[i]["femur"] = beta
-        poses[i]["tibia"] = gamma
+# Computes the points and angles of all legs at once
+# given the body contacts and the target foot tips (one leg per row)
+# Returns
+# - the points p0, p1, p2, p3 of each leg wrt its local frame, shape (n, 4, 3)
+# - alpha, beta and gamma of each leg, shape (n, 3)
+# - the twist of each leg frame wrt the hexapod's x axis
+# - the status of each leg as defined above
+# - which legs can't reach their target and are stretched towards it instead
+#
+# Nothing here raises, so the caller can decide which alert message to show
+def solve_legs(
+    body_contacts, foot_tips, coxia_axes, x_axis, z_axis, coxia, femur, tibia
+):
+    z_axis = z_axis / np.linalg.norm(z_axis)
+
+    # find the coxia vectors which are the vectors
+    # from body contact point to joint between coxia and femur limb
+    body_to_foot_vectors = foot_tips - body_contacts
+    heights = body_to_foot_vectors @ z_axis
+    projections = body_to_foot_vectors - np.outer(heights, z_axis)
+    projection_lengths = np.linalg.norm(projections, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unit_coxia_vectors = projections / projection_lengths[:, None]
+
+    # coxia point / joint is the point connecting the coxia and tibia limbs
+    coxia_points = body_contacts + unit_coxia_vectors * coxia
+    coxia_on_ground = coxia_points[:, 2] < foot_tips[:, 2]
+
+    # Find p3 aka foot tip (ground contact) with respect to the local leg frame
+    # The body to foot vector lies on the plane of the coxia vector and the z axis
+    # so the x of p3 is the length of its projection onto the ground plane
+    # and its z is its component along the z axis
+    p3x = projection_lengths
+    p3z = -np.abs(heights)
+
+    # These values are needed to compute
+    # p2 aka tibia joint (point between femur limb and tibia limb)
+    coxia_to_foot_x = p3x - coxia
+    d = np.hypot(coxia_to_foot_x, p3z)
+
+    # If we can form this triangle this means we probably can reach the target ground contact point
+    can_form_triangle = (tibia + femur > d) & (tibia + d > femur) & (femur + d > tibia)
+
+    # .................................
+    # CASE A: a triangle can be formed with
+    # coxia to foot vector, hexapod's femur and tibia
+    # .................................
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = (d ** 2 + femur ** 2 - tibia ** 2) / (2 * d * femur)
+        thetas = np.degrees(np.arccos(ratios))
+
+    # angle between the coxia to foot vector and the leg x axis
+    phis = np.degrees(np.arctan2(-p3z, coxia_to_foot_x))
+
+    triangle_betas = np.where(p3z > 0, thetas + phis, thetas - phis)  # case 3, 1 or 2
+    beta_radians = np.radians(triangle_betas)
+    triangle_p2x = coxia + femur * np.cos(beta_radians)
+    triangle_p2z = femur * np.sin(beta_radians)
+    triangle_gammas = 90 - angles_between_on_xz(
+        triangle_p2x - coxia, triangle_p2z, p3x - triangle_p2x, p3z - triangle_p2z
+    )
+    blocked = triangle_p2z < p3z
+
+    # .................................
+    # CASE B: It's impossible to reach target ground point
+    # Try to reach it by making the legs stretch
+    # i.e. p1, p2, p3 are all on the same line
+    # .................................
+    with np.errstate(divide="ignore", invalid="ignore"):
+        femur_x = femur * coxia_to_foot_x / d
+        femur_z = femur * p3z / d
+        tibia_x = tibia * coxia_to_foot_x / d
+        tibia_z = tibia * p3z / d
+
+    stretched_p2x = coxia + femur_x
+    stretched_p3x = stretched_p2x + tibia_x
+    stretched_p3z = femur_z + tibia_z
+    stretched_betas = angles_between_on_xz(1.0, 0.0, femur_x, femur_z)
+    stretched_betas = np.where(femur_z < 0, -stretched_betas, stretched_betas)
+
+    leg_points = np.zeros((len(body_contacts), 4, 3))
+    leg_points[:, 1, 0] = coxia
+    leg_points[:, 2, 0] = np.where(can_form_triangle, triangle_p2x, stretched_p2x)
+    leg_points[:, 2, 2] = np.where(can_form_triangle, triangle_p2z, femur_z)
+    leg_points[:, 3, 0] = np.where(can_form_triangle, p3x, stretched_p3x)
+    leg_points[:, 3, 2] = np.where(can_form_triangle, p3z, stretched_p3z)
+
+    betas = np.where(can_form_triangle, triangle_betas, stretched_betas)
+    gammas = np.where(can_form_triangle, triangle_gammas, 0.0)
+
+    # .................................
+    # Find alpha and the twist of each leg frame
+    # wrt to hexapod's body contact point's x axis
+    # .................................
+    sin_twists = np.cross(x_axis, unit_coxia_vectors) @ z_axis
+    cos_twists = unit_coxia_vectors @ x_axis
+    twists = np.degrees(np.arctan2(sin_twists, cos_twists))
+    twists = np.where(np.isnan(twists), 0.0, twists)
+
+    # Same as compute_twist_wrt_to_world()
+    alphas = (twists - coxia_axes + 180.0) % 360.0 - 180.0
+
+    # The first condition that holds is the status of the leg
+    cant_form_triangle = ~can_form_triangle
+    femur_too_long = cant_form_triangle & (d + tibia < femur)
+    tibia_too_long = cant_form_triangle & (d + femur < tibia)
+    statuses = np.select(
+        [
+            coxia_on_ground,
+            can_form_triangle & blocked,
+            femur_too_long,
+            tibia_too_long,
+            (np.abs(betas) > BETA_MAX_ANGLE) | (np.abs(gammas) > GAMMA_MAX_ANGLE),
+            np.abs(alphas) > ALPHA_MAX_ANGLE,
+        ],
+        [
+            COXIA_ON_GROUND,
+            BLOCKED_BY_GROUND,
+            FEMUR_TOO_LONG,
+            TIBIA_TOO_LONG,
+            BETA_GAMMA_OUT_OF_RANGE,
+            ALPHA_OUT_OF_RANGE,
+        ],
+        default=LEG_OK,
+    )
+    stretched = cant_form_triangle & ~(
+        coxia_on_ground | femur_too_long | tibia_too_long
+    )
 
-    might_print_ik(poses, ik_parameters, hexapod)
-    return poses, hexapod
+    angles = np.column_stack([alphas, betas, gammas])
+    return leg_points, angles, twists, statuses, stretched
+
+
+# Converts the points of each leg from its local frame to the world frame
+# The leg frame is twisted about the body's z axis, rotated with the body
+# and moved to the leg's body contact point
+# Both rotations are combined first so each point is only transformed once
+def leg_points_wrt_world(leg_points, twists, body_rotation_frame, body_contacts):
+    twist_radians = np.radians(twists)
+    c, s = np.cos(twist_radians), np.sin(twist_radians)
+    twist_frames = np.zeros((len(twists), 3, 3))
+    twist_frames[:, 0, 0] = c
+    twist_frames[:, 0, 1] = -s
+    twist_frames[:, 1, 0] = s
+    twist_frames[:, 1, 1] = c
+    twist_frames[:, 2, 2] = 1
+
+    frames = body_rotation_frame[:3, :3] @ twist_frames
+    translation = body_rotation_frame[:3, 3] + body_contacts[:, None, :]
+    return leg_points @ frames.transpose(0, 2, 1) + translation
+
+
+def angles_between_on_xz(ax, az, bx, bz):
+    # Same as angle_between() but for many vectors at once
+    # given the x and z components of vectors lying on the xz plane
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_theta = (ax * bx + az * bz) / (np.hypot(ax, az) * np.hypot(bx, bz))
+        theta = np.degrees(np.arccos(cos_theta))
+
+    return np.where(np.isnan(theta), 0.0, theta)
@@ -1,6 +1,5 @@
 from settings import ASSERTION_ENABLED, ALPHA_MAX_ANGLE
-import numpy as np
-from copy import deepcopy
+import math
 from hexapod.ik_solver.helpers import (
     BODY_ON_GROUND_ALERT_MSG,
     COXIA_ON_GROUND_ALERT_MSG,
@@ -17,17 +16,19 @@ from hexapod.ik_solver.helpers import (
 from hexapod.const import HEXAPOD_POSE
 from hexapod.points import (
     Point,
+    X_AXIS,
+    dot,
     length,
     add_vectors,
     scalar_multiply,
     vector_from_to,
     get_unit_vector,
-    is_triangle,
     project_vector_onto_plane,
     angle_between,
     angle_opposite_of_last_side,
 )
 from hexapod.ik_solver.shared import (
+    detach_ground_contacts,
     update_hexapod_points,
     find_twist_frame,
     compute_twist_wrt_to_world,
@@ -42,9 +43,8 @@ class IKSolver:
     def __init__(self, hexapod, ik_parameters):
         self.hexapod = hexapod
         self.params = ik_parameters
-        self.leg_x_axis = Point(1, 0, 0)
         self.update_body_and_ground_contact_points()
-        self.poses = deepcopy(HEXAPOD_POSE)
+        self.poses = {i: dict(pose) for i, pose in HEXAPOD_POSE.items()}
 
         self.legs_up_in_the_air = []
         for i in range(hexapod.LEG_COUNT):
@@ -80,6 +80,7 @@ class IKSolver:
 
         self.hexapod.update_stance(self.params["hip_stance"], self.params["leg_stance"])
         self.hexapod.detach_body_rotate_and_translate(rotx, roty, rotz, tx, ty, tz)
+        detach_ground_contacts(self.hexapod)
 
         if body_contact_shoved_on_ground(self.hexapod):
             raise Exception(BODY_ON_GROUND_ALERT_MSG)
@@ -97,6 +98,7 @@ class IKSolver:
         projection = project_vector_onto_plane(
             self.body_to_foot_vector, self.hexapod.z_axis
         )
+        self.projection_length = length(projection)
         self.unit_coxia_vector = get_unit_vector(projection)
         self.coxia_vector = scalar_multiply(self.unit_coxia_vector, self.hexapod.coxia)
 
@@ -110,21 +112,23 @@ class IKSolver:
         self.p1 = Point(self.hexapod.coxia, 0, 0)
 
         # Find p3 aka foot tip (ground contact) with respect to the local leg frame
-        rho = angle_between(self.unit_coxia_vector, self.body_to_foot_vector)
-        body_to_foot_length = length(self.body_to_foot_vector)
-        p3x = body_to_foot_length * np.cos(np.radians(rho))
-        p3z = -body_to_foot_length * np.sin(np.radians(rho))
+        # The body to foot vector lies on the plane of the coxia vector and the z axis
+        # so the x of p3 is the length of its projection onto the ground plane
+        # and its z is its component along the z axis
+        p3x = self.projection_length
+        p3z = -abs(dot(self.body_to_foot_vector, self.hexapod.z_axis))
         self.p3 = Point(p3x, 0, p3z)
 
     def compute_beta_gamma_local_p2(self):
         # These values are needed to compute
         # p2 aka tibia joint (point between femur limb and tibia limb)
         self.coxia_to_foot_vector2d = vector_from_to(self.p1, self.p3)
-        self.d = length(self.coxia_to_foot_vector2d)
+        self.d = d = length(self.coxia_to_foot_vector2d)
+        femur, tibia = self.hexapod.femur, self.hexapod.tibia
 
         # If we can form this triangle
         # # this means we probably can reach the target ground contact point
-        if is_triangle(self.hexapod.tibia, self.hexapod.femur, self.d):
+        if (tibia + femur > d) and (tibia + d > femur) and (femur + d > tibia):
             # CASE A: a triangle can be formed with
             # coxia to foot vector, hexapod's femur and tibia
             self.compute_when_triangle_can_form()
@@ -142,14 +146,18 @@ class IKSolver:
         theta = angle_opposite_of_last_side(
             self.d, self.hexapod.femur, self.hexapod.tibia
         )
-        phi = angle_between(self.coxia_to_foot_vector2d, self.leg_x_axis)
+        # angle between the coxia to foot vector and the leg x axis
+        phi = math.degrees(
+            math.atan2(-self.coxia_to_foot_vector2d.z, self.coxia_to_foot_vector2d.x)
+        )
 
         self.beta = theta - phi  # case 1 or 2
         if self.p3.z > 0:  # case 3
             self.beta = theta + phi
 
-        z_ = self.hexapod.femur * np.sin(np.radians(self.beta))
-        x_ = self.p1.x + self.hexapod.femur * np.cos(np.radians(self.beta))
+        beta_radians = math.radians(self.beta)
+        z_ = self.hexapod.femur * math.sin(beta_radians)
+        x_ = self.p1.x + self.hexapod.femur * math.cos(beta_radians)
 
         self.p2 = Point(x_, 0, z_)
         femur_vector = vector_from_to(self.p1, self.p2)
@@ -160,12 +168,13 @@ class IKSolver:
             raise Exception(cant_reach_alert_msg(self.leg_name, "blocking"))
 
     def might_raise_cant_reach_target(self):
-        if self.d + self.hexapod.tibia < self.hexapod.femur:
+        d, femur, tibia = self.d, self.hexapod.femur, self.hexapod.tibia
+        if d + tibia < femur:
             raise Exception(cant_reach_alert_msg(self.leg_name, "femur"))
-        if self.d + self.hexapod.femur < self.hexapod.tibia:
+        if d + femur < tibia:
             raise Exception(cant_reach_alert_msg(self.leg_name, "tibia"))
 
-        # Then hexapod.femur + hexapod.tibia < d:
+        # Then femur + tibia < d:
         self.legs_up_in_the_air.append(self.leg_name)
         LEGS_TOO_SHORT, alert_msg = legs_too_short(self.legs_up_in_the_air)
         if LEGS_TOO_SHORT:
@@ -182,7 +191,7 @@ class IKSolver:
 
         # Find beta and gamma
         self.gamma = 0.0
-        self.beta = angle_between(self.leg_x_axis, femur_vector)
+        self.beta = angle_between(X_AXIS, femur_vector)
         if femur_vector.z < 0:
             self.beta = -self.beta
 
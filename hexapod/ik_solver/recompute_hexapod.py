@@ -1,9 +1,8 @@
-from copy import deepcopy
 from hexapod.models import VirtualHexapod, Hexagon
 from hexapod.points import (
     angle_between,
     is_counter_clockwise,
-    Point,
+    FixedPoint,
     rotz,
     vector_from_to,
     length,
@@ -11,6 +10,8 @@ from hexapod.points import (
 from settings import ASSERTION_ENABLED, PRINT_IK
 import numpy as np
 
+NEGATIVE_Z_AXIS = FixedPoint(0, 0, -1)
+
 
 def recompute_hexapod(dimensions, ik_parameters, poses):
 
@@ -18,22 +19,22 @@ def recompute_hexapod(dimensions, ik_parameters, poses):
     # update the hexapod so that we know which given points are in contact with the ground
     old_hexapod = VirtualHexapod(dimensions)
     old_hexapod.update_stance(ik_parameters["hip_stance"], ik_parameters["leg_stance"])
-    old_contacts = deepcopy(old_hexapod.ground_contacts)
+    old_contacts = [point.copy() for point in old_hexapod.ground_contacts]
 
     # make a new hexapod with all angles = 0
     # and update given the poses/ angles we've computed
     new_hexapod = VirtualHexapod(dimensions)
     new_hexapod.update(poses)
-    new_contacts = deepcopy(new_hexapod.ground_contacts)
+    new_contacts = [point.copy() for point in new_hexapod.ground_contacts]
 
     # get two points that are on the ground before and after
     # updating to the given poses
     id1, id2 = find_two_same_leg_ids(old_contacts, new_contacts)
 
-    old_p1 = deepcopy(old_hexapod.legs[id1].ground_contact())
-    old_p2 = deepcopy(old_hexapod.legs[id2].ground_contact())
-    new_p1 = deepcopy(new_hexapod.legs[id1].ground_contact())
-    new_p2 = deepcopy(new_hexapod.legs[id2].ground_contact())
+    old_p1 = old_hexapod.legs[id1].ground_contact().copy()
+    old_p2 = old_hexapod.legs[id2].ground_contact().copy()
+    new_p1 = new_hexapod.legs[id1].ground_contact().copy()
+    new_p2 = new_hexapod.legs[id2].ground_contact().copy()
 
     # we must translate and rotate the hexapod with the pose
     # so that the hexapod is stepping on the old predefined ground contact points
@@ -91,8 +92,7 @@ def find_two_same_leg_ids(old_contacts, new_contacts):
 
 def find_twist_to_recompute_hexapod(a, b):
     twist = angle_between(a, b)
-    z_axis = Point(0, 0, -1)
-    is_ccw = is_counter_clockwise(a, b, z_axis)
+    is_ccw = is_counter_clockwise(a, b, NEGATIVE_Z_AXIS)
     if is_ccw:
         twist = -twist
 
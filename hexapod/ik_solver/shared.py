@@ -1,33 +1,35 @@
-from hexapod.points import is_counter_clockwise, angle_between, rotz
+import math
+from hexapod.points import dot, cross, rotz
 
 
-def update_hexapod_points(hexapod, leg_id, points):
-    points[0].name = hexapod.legs[leg_id].p0.name
-    points[1].name = hexapod.legs[leg_id].p1.name
-    points[2].name = hexapod.legs[leg_id].p2.name
-    points[3].name = hexapod.legs[leg_id].p3.name
+# The ground contacts of the hexapod are views of its leg points
+# Copy them before the solver moves the legs so they stay
+# at the target ground contacts, legs that can't reach them included
+def detach_ground_contacts(hexapod):
+    hexapod.ground_contacts = [point.copy() for point in hexapod.ground_contacts]
+
 
-    hexapod.legs[leg_id].p0 = points[0]
-    hexapod.legs[leg_id].p1 = points[1]
-    hexapod.legs[leg_id].p2 = points[2]
-    hexapod.legs[leg_id].p3 = points[3]
+def update_hexapod_points(hexapod, leg_id, points):
+    hexapod.leg_points[leg_id] = [(point.x, point.y, point.z) for point in points]
 
 
 def find_twist_frame(hexapod, unit_coxia_vector):
-    twist = angle_between(unit_coxia_vector, hexapod.x_axis)
-    is_ccw = is_counter_clockwise(unit_coxia_vector, hexapod.x_axis, hexapod.z_axis)
-    if is_ccw:
-        twist = -twist
+    # The signed angle from the hexapod's x axis to the coxia vector
+    # about the hexapod's z axis, positive when counter clockwise
+    x_axis = hexapod.x_axis
+    sin_twist = dot(cross(x_axis, unit_coxia_vector), hexapod.z_axis)
+    cos_twist = dot(x_axis, unit_coxia_vector)
+    twist = math.degrees(math.atan2(sin_twist, cos_twist))
+
+    # The coxia vector is undefined (NaN) when the foot tip is directly
+    # below the body contact, treat it as not twisted like solve_legs() does
+    if math.isnan(twist):
+        twist = 0.0
 
     twist_frame = rotz(twist)
     return twist, twist_frame
 
 
+# The twist wrt to the coxia axis, wrapped to [-180, 180)
 def compute_twist_wrt_to_world(alpha, coxia_axis):
-    alpha = (alpha - coxia_axis) % 360
-    if alpha > 180:
-        alpha = alpha - 360
-    elif alpha < -180:
-        alpha = 360 + alpha
-
-    return alpha
+    return (alpha - coxia_axis + 180.0) % 360.0 - 180.0
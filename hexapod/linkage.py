@@ -58,9 +58,10 @@
 #
 
 import numpy as np
-from copy import deepcopy
 from .points import (
     Point,
+    PointView,
+    get_points_wrt,
     frame_yrotate_xtranslate,
     frame_zrotate_xytranslate,
 )
@@ -81,6 +82,7 @@ class Linkage:
         new_origin=Point(0, 0, 0),
         name=None,
         id_number=None,
+        points_store=None,
     ):
         self._a = a
         self._b = b
@@ -89,8 +91,25 @@ class Linkage:
         self._coxia_axis = coxia_axis
         self.id = id_number
         self.name = name
+
+        # The x, y, z of p0, p1, p2, p3 are the rows of points_store[id_number]
+        # The hexapod shares one store between all of its legs
+        if points_store is None:
+            points_store, store_index = np.zeros((1, 4, 3)), 0
+        else:
+            store_index = id_number
+
+        self._points_store = points_store
+        self._store_index = store_index
+        self.all_points = [PointView(points_store, (store_index, i)) for i in range(4)]
+        self.p0, self.p1, self.p2, self.p3 = self.all_points
         self.change_pose(alpha, beta, gamma)
 
+    # The (4, 3) array of the x, y, z of p0, p1, p2, p3
+    @property
+    def points(self):
+        return self._points_store[self._store_index]
+
     def coxia_angle(self):
         return self._alpha
 
@@ -123,27 +142,21 @@ class Linkage:
         )
 
         # find points wrt to body contact point
-        p0 = Point(0, 0, 0)
-        p1 = p0.get_point_wrt(frame_01)
-        p2 = p0.get_point_wrt(frame_02)
-        p3 = p0.get_point_wrt(frame_03)
+        # (the origin of each frame i.e. its translation)
+        local_points = np.array([frame_01[:3, 3], frame_02[:3, 3], frame_03[:3, 3]])
 
         # find points wrt to center of gravity
-        self.p0 = deepcopy(self._new_origin)
-        self.p0.name += "-body-contact"
-        self.p1 = p1.get_point_wrt(new_frame, name=self.name + "-coxia")
-        self.p2 = p2.get_point_wrt(new_frame, name=self.name + "-femur")
-        self.p3 = p3.get_point_wrt(new_frame, name=self.name + "-tibia")
-
-        self.all_points = [self.p0, self.p1, self.p2, self.p3]
+        points = self.points
+        origin = self._new_origin
+        points[0] = origin.x, origin.y, origin.z
+        points[1:] = get_points_wrt(local_points, new_frame)
+
+        self.p0.name = origin.name + "-body-contact"
+        self.p1.name = self.name + "-coxia"
+        self.p2.name = self.name + "-femur"
+        self.p3.name = self.name + "-tibia"
         self.ground_contact_point = self.compute_ground_contact()
 
-    def update_leg_wrt(self, frame, height):
-        self.p0.update_point_wrt(frame, height)
-        self.p1.update_point_wrt(frame, height)
-        self.p2.update_point_wrt(frame, height)
-        self.p3.update_point_wrt(frame, height)
-
     def compute_ground_contact(self):
         # ❗IMPORTANT: Verify if this assumption is correct
         # Which has the most negative z? p0, p1, p2, or p3?
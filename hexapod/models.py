@@ -1,7 +1,6 @@
 # The module contains the model of a hexapod
 # Use it to manipulate the pose of the hexapod
 import numpy as np
-from copy import deepcopy
 import json
 from pprint import pprint
 from settings import PRINT_MODEL_ON_UPDATE
@@ -10,6 +9,9 @@ from .ground_contact_solver import get_legs_on_ground
 from .templates.pose_template import HEXAPOD_POSE
 from .points import (
     Point,
+    Z_AXIS,
+    do_nothing,
+    get_points_wrt,
     frame_to_align_vector_a_to_b,
     frame_rotxyz,
     rotz,
@@ -65,6 +67,8 @@ class Hexagon:
         "right-back",
     ]
     COXIA_AXES = [0, 45, 135, 180, 225, 315]
+    # Same as COXIA_AXES, for computing the angles of all the legs at once
+    COXIA_AXES_ARRAY = np.array(COXIA_AXES, dtype=np.float64)
 
     def __init__(self, f, m, s):
         self.f = f
@@ -99,7 +103,7 @@ class VirtualHexapod:
     def update(self, poses):
         self.body_rotation_frame = None
         might_twist = find_if_might_twist(self, poses)
-        old_contacts = deepcopy(self.ground_contacts)
+        old_contacts = [point.copy() for point in self.ground_contacts]
 
         # Update leg poses
         for _, pose in poses.items():
@@ -114,7 +118,7 @@ class VirtualHexapod:
             raise Exception("❗Pose Unstable. COG not inside support polygon.")
 
         # Tilt and shift the hexapod based on new normal
-        frame = frame_to_align_vector_a_to_b(self.n_axis, Point(0, 0, 1))
+        frame = frame_to_align_vector_a_to_b(self.n_axis, Z_AXIS)
         self.rotate_and_shift(frame, height)
         self._update_local_frame(frame)
 
@@ -143,12 +147,10 @@ class VirtualHexapod:
         for point in self.body.all_points:
             point.move_xyz(tx, ty, tz)
 
-        for leg in self.legs:
-            for point in leg.all_points:
-                point.move_xyz(tx, ty, tz)
+        self.leg_points += (tx, ty, tz)
 
     def update_stance(self, hip_stance, leg_stance):
-        pose = deepcopy(HEXAPOD_POSE)
+        pose = {i: dict(leg_pose) for i, leg_pose in HEXAPOD_POSE.items()}
         pose[1]["coxia"] = -hip_stance  # right_front
         pose[2]["coxia"] = hip_stance  # left_front
         pose[4]["coxia"] = -hip_stance  # left_back
@@ -178,6 +180,9 @@ class VirtualHexapod:
         self.body = Hexagon(f, m, s)
 
     def _init_legs(self):
+        # The points p0, p1, p2, p3 of each leg,
+        # every leg's points are views of its row
+        self.leg_points = np.zeros((VirtualHexapod.LEG_COUNT, 4, 3))
         self.legs = []
         for i in range(VirtualHexapod.LEG_COUNT):
             linkage = Linkage(
@@ -188,6 +193,7 @@ class VirtualHexapod:
                 new_origin=self.body.vertices[i],
                 name=Hexagon.VERTEX_NAMES[i],
                 id_number=i,
+                points_store=self.leg_points,
             )
             self.legs.append(linkage)
 
@@ -197,8 +203,7 @@ class VirtualHexapod:
         for vertex in self.body.all_points:
             vertex.update_point_wrt(frame, height)
 
-        for leg in self.legs:
-            leg.update_leg_wrt(frame, height)
+        self.leg_points[:] = get_points_wrt(self.leg_points, frame, height)
 
     def _init_local_frame(self):
         self.x_axis = Point(1, 0, 0, name="hexapod x axis")
@@ -301,10 +306,7 @@ def find_twist_frame(old_ground_contacts, new_ground_contacts):
     return twist_frame
 
 
-def might_print_hexapod(hexapod, poses):
-    if not PRINT_MODEL_ON_UPDATE:
-        return
-
+def print_hexapod(hexapod, poses):
     print("█████████████████████████████")
     print("█ start: Hexapod Model      █")
     print("█████████████████████████████")
@@ -334,3 +336,6 @@ def might_print_hexapod(hexapod, poses):
     print("█████████████████████████████")
     print("█ end: Hexapod Model        █")
     print("█████████████████████████████")
+
+
+might_print_hexapod = print_hexapod if PRINT_MODEL_ON_UPDATE else do_nothing
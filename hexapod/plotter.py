@@ -4,6 +4,7 @@
 # it takes in a hexapod model, and the figure to update
 # you can also update the camera view with it by passing a camera dictionary
 # ********************
+from .points import points_to_array
 
 
 class HexapodPlot:
@@ -15,39 +16,42 @@ class HexapodPlot:
         points = hexapod.body.vertices + [hexapod.body.vertices[0]]
 
         # Body Surface Mesh
-        fig["data"][0]["x"] = [point.x for point in points]
-        fig["data"][0]["y"] = [point.y for point in points]
-        fig["data"][0]["z"] = [point.z for point in points]
+        x, y, z = points_to_array(points).T
+        fig["data"][0]["x"] = x
+        fig["data"][0]["y"] = y
+        fig["data"][0]["z"] = z
 
         # Body Outline
-        fig["data"][1]["x"] = fig["data"][0]["x"]
-        fig["data"][1]["y"] = fig["data"][0]["y"]
-        fig["data"][1]["z"] = fig["data"][0]["z"]
+        fig["data"][1]["x"] = x
+        fig["data"][1]["y"] = y
+        fig["data"][1]["z"] = z
 
-        fig["data"][2]["x"] = [hexapod.body.cog.x]
-        fig["data"][2]["y"] = [hexapod.body.cog.y]
-        fig["data"][2]["z"] = [hexapod.body.cog.z]
+        x, y, z = points_to_array([hexapod.body.cog]).T
+        fig["data"][2]["x"] = x
+        fig["data"][2]["y"] = y
+        fig["data"][2]["z"] = z
 
-        fig["data"][3]["x"] = [hexapod.body.head.x]
-        fig["data"][3]["y"] = [hexapod.body.head.y]
-        fig["data"][3]["z"] = [hexapod.body.head.z]
+        x, y, z = points_to_array([hexapod.body.head]).T
+        fig["data"][3]["x"] = x
+        fig["data"][3]["y"] = y
+        fig["data"][3]["z"] = z
 
         # Legs
         n = [i for i in range(4, 10)]
 
-        for n, leg in zip(n, hexapod.legs):
-            points = [leg.p0, leg.p1, leg.p2, leg.p3]
-            fig["data"][n]["x"] = [point.x for point in points]
-            fig["data"][n]["y"] = [point.y for point in points]
-            fig["data"][n]["z"] = [point.z for point in points]
+        for n, leg_points in zip(n, hexapod.leg_points):
+            x, y, z = leg_points.T.copy()
+            fig["data"][n]["x"] = x
+            fig["data"][n]["y"] = y
+            fig["data"][n]["z"] = z
 
         # Hexapod Support Polygon
         # Draw a mesh for body contact on ground
         dz = -1  # Mesh must be slightly below ground
-        ground_contacts = hexapod.ground_contacts
-        fig["data"][10]["x"] = [point.x for point in ground_contacts]
-        fig["data"][10]["y"] = [point.y for point in ground_contacts]
-        fig["data"][10]["z"] = [(point.z + dz) for point in ground_contacts]
+        x, y, z = points_to_array(hexapod.ground_contacts).T
+        fig["data"][10]["x"] = x
+        fig["data"][10]["y"] = y
+        fig["data"][10]["z"] = z + dz
 
         return fig
 
@@ -3,10 +3,16 @@
 # and finding properties and relationships of vectors
 # computing reference frames
 from settings import DEBUG_MODE
+from collections import namedtuple
+import math
 import numpy as np
 
 
+# Points are created for every intermediate vector,
+# __slots__ keeps them small and their attributes quick to access
 class Point:
+    __slots__ = ("x", "y", "z", "name")
+
     def __init__(self, x, y, z, name=None):
         self.x = x
         self.y = y
@@ -28,6 +34,9 @@ class Point:
         self.y = p[1]
         self.z = p[2] + z
 
+    def copy(self):
+        return Point(self.x, self.y, self.z, self.name)
+
     def move_xyz(self, x, y, z):
         self.x += x
         self.y += y
@@ -50,6 +59,52 @@ class Point:
         return equal_x and equal_y and equal_z and equal_name
 
 
+# A point whose x, y and z are stored in a row of a shared array
+# e.g. the (LEG_COUNT, 4, 3) array that holds the points of all the legs
+# so they can be transformed at once without gathering them first
+# index is the position of the row in that array e.g. (leg_id, point_id)
+class PointView(Point):
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store, index, name=None):
+        self._store = store
+        self._index = index
+        self.name = name
+
+    @property
+    def x(self):
+        return self._store.item(*self._index, 0)
+
+    @x.setter
+    def x(self, value):
+        self._store[(*self._index, 0)] = value
+
+    @property
+    def y(self):
+        return self._store.item(*self._index, 1)
+
+    @y.setter
+    def y(self, value):
+        self._store[(*self._index, 1)] = value
+
+    @property
+    def z(self):
+        return self._store.item(*self._index, 2)
+
+    @z.setter
+    def z(self, value):
+        self._store[(*self._index, 2)] = value
+
+
+# Read-only point for constants that are shared between calls
+# Pass it to any function here that only reads x, y and z
+FixedPoint = namedtuple("FixedPoint", ["x", "y", "z"])
+
+ORIGIN = FixedPoint(0, 0, 0)
+X_AXIS = FixedPoint(1, 0, 0)
+Z_AXIS = FixedPoint(0, 0, 1)
+
+
 # *********************************************
 # https://stackoverflow.com/questions/2049582/how-to-determine-if-a-point-is-in-a-2d-triangle
 # https://www.geeksforgeeks.org/check-whether-a-given-point-lies-inside-a-triangle-or-not/
@@ -67,10 +122,6 @@ def is_point_inside_triangle(p, a, b, c):
     return (ab < 0.0) == (bc < 0.0) == (ca < 0.0)
 
 
-def is_triangle(a, b, c):
-    return (a + b > c) and (a + c > b) and (b + c > a)
-
-
 # https://www.maplesoft.com/support/help/Maple/view.aspx?path=MathApps%2FProjectionOfVectorOntoPlane
 # u is the vector, n is the plane normal
 def project_vector_onto_plane(u, n):
@@ -80,6 +131,12 @@ def project_vector_onto_plane(u, n):
     return vector
 
 
+# The debug checks and prints turned off in settings are bound to this
+# once at import, so they are not checking the settings on every call
+def do_nothing(*args, **kwargs):
+    pass
+
+
 def might_print_angle_between_error(a, b):
     if DEBUG_MODE:
         print(
@@ -114,6 +171,19 @@ def is_counter_clockwise(a, b, n):
     return dot(a, cross(b, n)) > 0
 
 
+# Stacks the x, y, z of the points as the rows of a (len(points), 3) array
+def points_to_array(points):
+    return np.array([[point.x, point.y, point.z] for point in points], dtype=np.float64)
+
+
+# Same as Point.update_point_wrt
+# but for an array of points with shape (..., 3)
+def get_points_wrt(points, reference_frame, z=0):
+    points = points @ reference_frame[:3, :3].T + reference_frame[:3, 3]
+    points[..., 2] += z
+    return points
+
+
 # https://math.stackexchange.com/questions/180418/calculate-rotation-matrix-to-align-vector-a-to-vector-b-in-3d
 def frame_to_align_vector_a_to_b(a, b):
 
@@ -180,9 +250,9 @@ def rotz(theta):
 
 
 def _return_sin_and_cos(theta):
-    d = np.radians(theta)
-    c = np.cos(d)
-    s = np.sin(d)
+    d = math.radians(theta)
+    c = math.cos(d)
+    s = math.sin(d)
     return c, s
 
 
@@ -223,7 +293,9 @@ def scalar_multiply(p, s):
 
 
 def get_unit_vector(v):
-    return scale(v, length(v))
+    # A zero vector has no direction, its unit vector is NaN
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return scale(v, length(v))
 
 
 def get_unit_normal(a, b, c):
@@ -1,3 +1,4 @@
+import numpy as np
 from style_settings import (
     BODY_MESH_COLOR,
     BODY_MESH_OPACITY,
@@ -25,9 +26,9 @@ data = [
         "opacity": BODY_MESH_OPACITY,
         "color": BODY_MESH_COLOR,
         "uid": "1f821e07-2c02-4a64-8ce3-61ecfe2a91b6",
-        "x": [100.0, 100.0, -100.0, -100.0, -100.0, 100.0, 100.0],
-        "y": [0.0, 100.0, 100.0, 0.0, -100.0, -100.0, 0.0],
-        "z": [100.0, 100.0, 100.0, 100.0, 100.0, 100.0, 100.0],
+        "x": np.array([100.0, 100.0, -100.0, -100.0, -100.0, 100.0, 100.0]),
+        "y": np.array([0.0, 100.0, 100.0, 0.0, -100.0, -100.0, 0.0]),
+        "z": np.array([100.0, 100.0, 100.0, 100.0, 100.0, 100.0, 100.0]),
     },
     {
         "line": {"color": BODY_COLOR, "opacity": 1.0, "width": BODY_OUTLINE_WIDTH},
@@ -35,9 +36,9 @@ data = [
         "showlegend": True,
         "type": "scatter3d",
         "uid": "1f821e07-2c02-4a64-8ce3-61ecfe2a91b6",
-        "x": [100.0, 100.0, -100.0, -100.0, -100.0, 100.0, 100.0],
-        "y": [0.0, 100.0, 100.0, 0.0, -100.0, -100.0, 0.0],
-        "z": [100.0, 100.0, 100.0, 100.0, 100.0, 100.0, 100.0],
+        "x": np.array([100.0, 100.0, -100.0, -100.0, -100.0, 100.0, 100.0]),
+        "y": np.array([0.0, 100.0, 100.0, 0.0, -100.0, -100.0, 0.0]),
+        "z": np.array([100.0, 100.0, 100.0, 100.0, 100.0, 100.0, 100.0]),
     },
     {
         "marker": {"color": COG_COLOR, "opacity": 1, "size": COG_SIZE},
@@ -45,9 +46,9 @@ data = [
         "name": "cog",
         "type": "scatter3d",
         "uid": "a819d0e4-ddaa-476b-b3e4-48fd766e749c",
-        "x": [0.0],
-        "y": [0.0],
-        "z": [100.0],
+        "x": np.array([0.0]),
+        "y": np.array([0.0]),
+        "z": np.array([100.0]),
     },
     {
         "marker": {"color": BODY_COLOR, "opacity": 1.0, "size": HEAD_SIZE},
@@ -55,9 +56,9 @@ data = [
         "name": "head",
         "type": "scatter3d",
         "uid": "508caa99-c538-4cb6-b022-fbbb31c2350b",
-        "x": [0.0],
-        "y": [100.0],
-        "z": [100.0],
+        "x": np.array([0.0]),
+        "y": np.array([100.0]),
+        "z": np.array([100.0]),
     },
     {
         "line": {"color": LEG_COLOR, "width": LEG_OUTLINE_WIDTH},
@@ -65,9 +66,9 @@ data = [
         "showlegend": False,
         "type": "scatter3d",
         "uid": "f217db57-fe6e-4b40-90f8-4e1c20ef595e",
-        "x": [100.0, 200.0, 300.0, 300.0],
-        "y": [0.0, 0.0, 0.0, 0.0],
-        "z": [100.0, 100.0, 100.0, 0.0],
+        "x": np.array([100.0, 200.0, 300.0, 300.0]),
+        "y": np.array([0.0, 0.0, 0.0, 0.0]),
+        "z": np.array([100.0, 100.0, 100.0, 0.0]),
     },
     {
         "line": {"color": LEG_COLOR, "width": LEG_OUTLINE_WIDTH},
@@ -75,9 +76,13 @@ data = [
         "showlegend": False,
         "type": "scatter3d",
         "uid": "d5690122-cd54-460d-ab3e-1f910eb88f0f",
-        "x": [100.0, 170.71067811865476, 241.4213562373095, 241.4213562373095],
-        "y": [100.0, 170.71067811865476, 241.42135623730948, 241.42135623730948],
-        "z": [100.0, 100.0, 100.0, 0.0],
+        "x": np.array(
+            [100.0, 170.71067811865476, 241.4213562373095, 241.4213562373095]
+        ),
+        "y": np.array(
+            [100.0, 170.71067811865476, 241.42135623730948, 241.42135623730948]
+        ),
+        "z": np.array([100.0, 100.0, 100.0, 0.0]),
     },
     {
         "line": {"color": LEG_COLOR, "width": LEG_OUTLINE_WIDTH},
@@ -85,9 +90,13 @@ data = [
         "showlegend": False,
         "type": "scatter3d",
         "uid": "9f13f416-f2b7-4eb7-993c-1e26e2e7a908",
-        "x": [-100.0, -170.71067811865476, -241.42135623730948, -241.42135623730948],
-        "y": [100.0, 170.71067811865476, 241.4213562373095, 241.4213562373095],
-        "z": [100.0, 100.0, 100.0, 0.0],
+        "x": np.array(
+            [-100.0, -170.71067811865476, -241.42135623730948, -241.42135623730948]
+        ),
+        "y": np.array(
+            [100.0, 170.71067811865476, 241.4213562373095, 241.4213562373095]
+        ),
+        "z": np.array([100.0, 100.0, 100.0, 0.0]),
     },
     {
         "line": {"color": LEG_COLOR, "width": LEG_OUTLINE_WIDTH},
@@ -95,14 +104,16 @@ data = [
         "showlegend": False,
         "type": "scatter3d",
         "uid": "0d426c49-19a4-4051-b938-81b30c962dff",
-        "x": [-100.0, -200.0, -300.0, -300.0],
-        "y": [
-            0.0,
-            1.2246467991473532e-14,
-            2.4492935982947064e-14,
-            2.4492935982947064e-14,
-        ],
-        "z": [100.0, 100.0, 100.0, 0.0],
+        "x": np.array([-100.0, -200.0, -300.0, -300.0]),
+        "y": np.array(
+            [
+                0.0,
+                1.2246467991473532e-14,
+                2.4492935982947064e-14,
+                2.4492935982947064e-14,
+            ]
+        ),
+        "z": np.array([100.0, 100.0, 100.0, 0.0]),
     },
     {
         "line": {"color": LEG_COLOR, "width": LEG_OUTLINE_WIDTH},
@@ -110,9 +121,13 @@ data = [
         "showlegend": False,
         "type": "scatter3d",
         "uid": "5ba25594-2fb5-407e-a16f-118f12769e28",
-        "x": [-100.0, -170.71067811865476, -241.42135623730954, -241.42135623730954],
-        "y": [-100.0, -170.71067811865476, -241.42135623730948, -241.42135623730948],
-        "z": [100.0, 100.0, 100.0, 0.0],
+        "x": np.array(
+            [-100.0, -170.71067811865476, -241.42135623730954, -241.42135623730954]
+        ),
+        "y": np.array(
+            [-100.0, -170.71067811865476, -241.42135623730948, -241.42135623730948]
+        ),
+        "z": np.array([100.0, 100.0, 100.0, 0.0]),
     },
     {
         "line": {"color": LEG_COLOR, "width": LEG_OUTLINE_WIDTH},
@@ -120,9 +135,13 @@ data = [
         "showlegend": False,
         "type": "scatter3d",
         "uid": "fa4b5f98-7d68-4eb9-bd38-a6f8dabef8a4",
-        "x": [100.0, 170.71067811865476, 241.42135623730948, 241.42135623730948],
-        "y": [-100.0, -170.71067811865476, -241.42135623730954, -241.42135623730954],
-        "z": [100.0, 100.0, 100.0, 0.0],
+        "x": np.array(
+            [100.0, 170.71067811865476, 241.42135623730948, 241.42135623730948]
+        ),
+        "y": np.array(
+            [-100.0, -170.71067811865476, -241.42135623730954, -241.42135623730954]
+        ),
+        "z": np.array([100.0, 100.0, 100.0, 0.0]),
     },
     {
         "name": "support polygon mesh",
@@ -131,23 +150,27 @@ data = [
         "opacity": SUPPORT_POLYGON_MESH_OPACITY,
         "color": SUPPORT_POLYGON_MESH_COLOR,
         "uid": "1f821e07-2c02-4a64-8ce3-61ecfe2a91b6",
-        "x": [
-            300.0,
-            241.4213562373095,
-            -241.42135623730948,
-            -300.0,
-            -241.42135623730954,
-            241.42135623730948,
-        ],
-        "y": [
-            0.0,
-            241.42135623730948,
-            241.4213562373095,
-            2.4492935982947064e-14,
-            -241.42135623730948,
-            -241.42135623730954,
-        ],
-        "z": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        "x": np.array(
+            [
+                300.0,
+                241.4213562373095,
+                -241.42135623730948,
+                -300.0,
+                -241.42135623730954,
+                241.42135623730948,
+            ]
+        ),
+        "y": np.array(
+            [
+                0.0,
+                241.42135623730948,
+                241.4213562373095,
+                2.4492935982947064e-14,
+                -241.42135623730948,
+                -241.42135623730954,
+            ]
+        ),
+        "z": np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0]),
     },
     {
         "line": {"color": "#2f3640", "width": 2},
@@ -157,9 +180,9 @@ data = [
         "opacity": 1.0,
         "type": "scatter3d",
         "uid": "d5690122-cd54-460d-ab3e-1f910eb88f0f",
-        "x": [0.0, 50.0],
-        "y": [0.0, 0.0],
-        "z": [100.0, 100.0],
+        "x": np.array([0.0, 50.0]),
+        "y": np.array([0.0, 0.0]),
+        "z": np.array([100.0, 100.0]),
     },
     {
         "line": {"color": "#e67e22", "width": 2},
@@ -169,9 +192,9 @@ data = [
         "opacity": 1.0,
         "type": "scatter3d",
         "uid": "d5690122-cd54-460d-ab3e-1f910eb88f0f",
-        "x": [0.0, 0.0],
-        "y": [0.0, 50.0],
-        "z": [100.0, 100.0],
+        "x": np.array([0.0, 0.0]),
+        "y": np.array([0.0, 50.0]),
+        "z": np.array([100.0, 100.0]),
     },
     {
         "line": {"color": "#0097e6", "width": 2},
@@ -181,9 +204,9 @@ data = [
         "opacity": 1.0,
         "type": "scatter3d",
         "uid": "d5690122-cd54-460d-ab3e-1f910eb88f0f",
-        "x": [0.0, 0.0],
-        "y": [0.0, 0.0],
-        "z": [100.0, 150.0],
+        "x": np.array([0.0, 0.0]),
+        "y": np.array([0.0, 0.0]),
+        "z": np.array([100.0, 150.0]),
     },
     {
         "line": {"color": "#2f3640", "width": 2},
@@ -193,9 +216,9 @@ data = [
         "opacity": 1.0,
         "type": "scatter3d",
         "uid": "d5690122-cd54-460d-ab3e-1f910eb88f0f",
-        "x": [0, 50],
-        "y": [0, 0],
-        "z": [0, 0],
+        "x": np.array([0, 50]),
+        "y": np.array([0, 0]),
+        "z": np.array([0, 0]),
     },
     {
         "line": {"color": "#e67e22", "width": 2},
@@ -205,9 +228,9 @@ data = [
         "opacity": 1.0,
         "type": "scatter3d",
         "uid": "d5690122-cd54-460d-ab3e-1f910eb88f0f",
-        "x": [0, 0],
-        "y": [0, 50],
-        "z": [0, 0],
+        "x": np.array([0, 0]),
+        "y": np.array([0, 50]),
+        "z": np.array([0, 0]),
     },
     {
         "line": {"color": "#0097e6", "width": 2},
@@ -217,9 +240,9 @@ data = [
         "opacity": 1.0,
         "type": "scatter3d",
         "uid": "d5690122-cd54-460d-ab3e-1f910eb88f0f",
-        "x": [0, 0],
-        "y": [0, 0],
-        "z": [0, 50],
+        "x": np.array([0, 0]),
+        "y": np.array([0, 0]),
+        "z": np.array([0, 50]),
     },
 ]
 
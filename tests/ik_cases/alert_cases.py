@@ -0,0 +1,320 @@
+# Inputs the inverse kinematics solvers must reject
+# and the alert message they show (see tests/README.md)
+# When several legs can't do the pose, the alert is for the first of them
+# (in leg order, right-middle to right-back)
+CASES = [
+    {
+        "description": "Body contact shoved on ground",
+        "given_dimensions": {
+            "front": 100,
+            "side": 120,
+            "middle": 20,
+            "coxia": 200,
+            "femur": 80,
+            "tibia": 20,
+        },
+        "given_ik_parameters": {
+            "hip_stance": 15,
+            "leg_stance": 0,
+            "percent_x": -0.25,
+            "percent_y": 1,
+            "percent_z": 0.5,
+            "rot_x": 30,
+            "rot_y": 0,
+            "rot_z": 15,
+        },
+        "correct_alert_msg": "Impossible at given height.\nbody contact shoved on ground",
+    },
+    {
+        "description": "Coxia point shoved on ground",
+        "given_dimensions": {
+            "front": 200,
+            "side": 40,
+            "middle": 80,
+            "coxia": 20,
+            "femur": 150,
+            "tibia": 150,
+        },
+        "given_ik_parameters": {
+            "hip_stance": 45,
+            "leg_stance": 45,
+            "percent_x": 0.5,
+            "percent_y": 1,
+            "percent_z": 0.5,
+            "rot_x": -20,
+            "rot_y": 30,
+            "rot_z": 0,
+        },
+        "correct_alert_msg": "Impossible at given height.\ncoxia joint shoved on ground",
+    },
+    {
+        "description": "The ground is blocking the path",
+        "given_dimensions": {
+            "front": 150,
+            "side": 200,
+            "middle": 200,
+            "coxia": 60,
+            "femur": 100,
+            "tibia": 100,
+        },
+        "given_ik_parameters": {
+            "hip_stance": 30,
+            "leg_stance": 90,
+            "percent_x": -0.25,
+            "percent_y": 0,
+            "percent_z": 1,
+            "rot_x": 10,
+            "rot_y": -20,
+            "rot_z": 15,
+        },
+        "correct_alert_msg": "left-middle leg cannot reach it because the ground is blocking the path.",
+    },
+    {
+        "description": "Femur length is too long",
+        "given_dimensions": {
+            "front": 80,
+            "side": 40,
+            "middle": 150,
+            "coxia": 150,
+            "femur": 150,
+            "tibia": 100,
+        },
+        "given_ik_parameters": {
+            "hip_stance": 30,
+            "leg_stance": 60,
+            "percent_x": 0.25,
+            "percent_y": 1,
+            "percent_z": 0.5,
+            "rot_x": 0,
+            "rot_y": 0,
+            "rot_z": -30,
+        },
+        # cant_reach_alert_msg() shows the blocking message for a femur that is too long
+        "correct_alert_msg": "right-front leg cannot reach it because the ground is blocking the path.",
+    },
+    {
+        "description": "Tibia length is too long",
+        "given_dimensions": {
+            "front": 150,
+            "side": 20,
+            "middle": 150,
+            "coxia": 20,
+            "femur": 100,
+            "tibia": 120,
+        },
+        "given_ik_parameters": {
+            "hip_stance": 30,
+            "leg_stance": 30,
+            "percent_x": 0.5,
+            "percent_y": 0,
+            "percent_z": 0,
+            "rot_x": 30,
+            "rot_y": 10,
+            "rot_z": 0,
+        },
+        # cant_reach_alert_msg() shows the femur message for a tibia that is too long
+        "correct_alert_msg": (
+            "Cannot reach target ground point.\n"
+            "Femur length of right-back leg is too long."
+        ),
+    },
+    {
+        "description": "Alpha beyond range of motion",
+        "given_dimensions": {
+            "front": 200,
+            "side": 20,
+            "middle": 150,
+            "coxia": 200,
+            "femur": 200,
+            "tibia": 200,
+        },
+        "given_ik_parameters": {
+            "hip_stance": 45,
+            "leg_stance": 45,
+            "percent_x": -0.25,
+            "percent_y": 0,
+            "percent_z": 0.5,
+            "rot_x": -20,
+            "rot_y": -20,
+            "rot_z": -30,
+        },
+        "correct_alert_msg": (
+            "The (alpha/coxia) (of right-back leg) required\n"
+            "            to do this pose is beyond the range of motion.\n"
+            "            Required: 95.9693238799536 degrees. Limit: 90 degrees."
+        ),
+    },
+    {
+        "description": "Too many legs off the floor",
+        "given_dimensions": {
+            "front": 80,
+            "side": 20,
+            "middle": 40,
+            "coxia": 150,
+            "femur": 40,
+            "tibia": 100,
+        },
+        "given_ik_parameters": {
+            "hip_stance": 0,
+            "leg_stance": 60,
+            "percent_x": -0.5,
+            "percent_y": 0,
+            "percent_z": 1,
+            "rot_x": 10,
+            "rot_y": 0,
+            "rot_z": 40,
+        },
+        "correct_alert_msg": (
+            "Unstable. Too many legs off the floor.\n"
+            "['right-middle', 'right-front', 'left-front', 'left-middle']"
+        ),
+    },
+    {
+        "description": "All left legs off the ground",
+        "given_dimensions": {
+            "front": 100,
+            "side": 20,
+            "middle": 150,
+            "coxia": 100,
+            "femur": 200,
+            "tibia": 100,
+        },
+        "given_ik_parameters": {
+            "hip_stance": 15,
+            "leg_stance": 15,
+            "percent_x": 0.5,
+            "percent_y": -1,
+            "percent_z": 1,
+            "rot_x": -20,
+            "rot_y": 10,
+            "rot_z": 40,
+        },
+        "correct_alert_msg": (
+            "Unstable. All left legs off the ground.\n"
+            "['left-front', 'left-middle', 'left-back']"
+        ),
+    },
+    {
+        "description": "All right legs off the ground",
+        "given_dimensions": {
+            "front": 20,
+            "side": 20,
+            "middle": 150,
+            "coxia": 100,
+            "femur": 40,
+            "tibia": 150,
+        },
+        "given_ik_parameters": {
+            "hip_stance": 15,
+            "leg_stance": 30,
+            "percent_x": 0,
+            "percent_y": -0.5,
+            "percent_z": 0.5,
+            "rot_x": 10,
+            "rot_y": -20,
+            "rot_z": 40,
+        },
+        "correct_alert_msg": (
+            "Unstable. All right legs off the ground.\n"
+            "['right-middle', 'right-front', 'right-back']"
+        ),
+    },
+    {
+        "description": "First failing leg wins: right-middle (tibia) before right-front (coxia)",
+        "given_dimensions": {
+            "front": 200,
+            "side": 120,
+            "middle": 40,
+            "coxia": 200,
+            "femur": 20,
+            "tibia": 80,
+        },
+        "given_ik_parameters": {
+            "hip_stance": 45,
+            "leg_stance": 0,
+            "percent_x": 0,
+            "percent_y": 0,
+            "percent_z": 0,
+            "rot_x": -20,
+            "rot_y": 10,
+            "rot_z": -30,
+        },
+        "correct_alert_msg": (
+            "Cannot reach target ground point.\n"
+            "Femur length of right-middle leg is too long."
+        ),
+    },
+    {
+        "description": "First failing leg wins: left-front (alpha) before right-back (tibia)",
+        "given_dimensions": {
+            "front": 20,
+            "side": 40,
+            "middle": 60,
+            "coxia": 150,
+            "femur": 20,
+            "tibia": 120,
+        },
+        "given_ik_parameters": {
+            "hip_stance": 0,
+            "leg_stance": 60,
+            "percent_x": -0.25,
+            "percent_y": -1,
+            "percent_z": 1,
+            "rot_x": 30,
+            "rot_y": 30,
+            "rot_z": 40,
+        },
+        "correct_alert_msg": (
+            "The (alpha/coxia) (of left-front leg) required\n"
+            "            to do this pose is beyond the range of motion.\n"
+            "            Required: -108.53412099595829 degrees. Limit: 90 degrees."
+        ),
+    },
+    {
+        "description": "First failing leg wins: left-front (blocked) before left-middle (alpha)",
+        "given_dimensions": {
+            "front": 120,
+            "side": 20,
+            "middle": 200,
+            "coxia": 80,
+            "femur": 150,
+            "tibia": 150,
+        },
+        "given_ik_parameters": {
+            "hip_stance": 30,
+            "leg_stance": 30,
+            "percent_x": -1,
+            "percent_y": -1,
+            "percent_z": -0.5,
+            "rot_x": 0,
+            "rot_y": 0,
+            "rot_z": -30,
+        },
+        "correct_alert_msg": "left-front leg cannot reach it because the ground is blocking the path.",
+    },
+    {
+        "description": "Legs too short is checked before the alpha of the same leg (left-back)",
+        "given_dimensions": {
+            "front": 40,
+            "side": 60,
+            "middle": 20,
+            "coxia": 150,
+            "femur": 20,
+            "tibia": 200,
+        },
+        "given_ik_parameters": {
+            "hip_stance": 45,
+            "leg_stance": 60,
+            "percent_x": 1,
+            "percent_y": -0.5,
+            "percent_z": 0.5,
+            "rot_x": 10,
+            "rot_y": 30,
+            "rot_z": 40,
+        },
+        "correct_alert_msg": (
+            "Unstable. All left legs off the ground.\n"
+            "['left-front', 'left-middle', 'left-back']"
+        ),
+    },
+]
@@ -0,0 +1,77 @@
+description = "IK legs pointing along the negative x axis"
+
+# ********************************
+# Dimensions
+# ********************************
+given_dimensions = {
+    "front": 60,
+    "side": 80,
+    "middle": 120,
+    "coxia": 40,
+    "femur": 130,
+    "tibia": 70,
+}
+
+# ********************************
+# IK Parameters
+# ********************************
+# The left front, left middle and left back legs point along the
+# negative x axis, where the twist of the leg is 180 degrees
+given_ik_parameters = {
+    "hip_stance": 45,
+    "leg_stance": 15,
+    "percent_x": 0.071,
+    "percent_y": 0,
+    "percent_z": 0,
+    "rot_x": 0,
+    "rot_y": 11.7,
+    "rot_z": 0,
+}
+
+# ********************************
+# Poses
+# ********************************
+correct_poses = {
+    0: {
+        "name": "right-middle",
+        "id": 0,
+        "coxia": 0.0,
+        "femur": 22.432404935828433,
+        "tibia": -29.71127608978489,
+    },
+    1: {
+        "name": "right-front",
+        "id": 1,
+        "coxia": -45.0,
+        "femur": 28.645904830642205,
+        "tibia": -29.912433864302727,
+    },
+    2: {
+        "name": "left-front",
+        "id": 2,
+        "coxia": 45.0,
+        "femur": -6.104323758189302,
+        "tibia": 6.074634592148115,
+    },
+    3: {
+        "name": "left-middle",
+        "id": 3,
+        "coxia": 0.0,
+        "femur": -11.534228269464645,
+        "tibia": 12.02966344164686,
+    },
+    4: {
+        "name": "left-back",
+        "id": 4,
+        "coxia": -45.0,
+        "femur": -6.104323758189302,
+        "tibia": 6.074634592148115,
+    },
+    5: {
+        "name": "right-back",
+        "id": 5,
+        "coxia": 45.0,
+        "femur": 28.645904830642205,
+        "tibia": -29.912433864302727,
+    },
+}
@@ -0,0 +1,77 @@
+description = "IK foot tip directly below its body contact"
+
+# ********************************
+# Dimensions
+# ********************************
+given_dimensions = {
+    "front": 100,
+    "side": 100,
+    "middle": 150,
+    "coxia": 10,
+    "femur": 20,
+    "tibia": 150,
+}
+
+# ********************************
+# IK Parameters
+# ********************************
+# Shifting the body by percent_x puts the body contact
+# of the right middle leg right above its foot tip
+given_ik_parameters = {
+    "hip_stance": 0,
+    "leg_stance": 0,
+    "percent_x": 0.2,
+    "percent_y": 0,
+    "percent_z": 0,
+    "rot_x": 0,
+    "rot_y": 0,
+    "rot_z": 0,
+}
+
+# ********************************
+# Poses
+# ********************************
+correct_poses = {
+    0: {
+        "name": "right-middle",
+        "id": 0,
+        "coxia": 0.0,
+        "femur": -8.583654759921359,
+        "tibia": -2.8659839825989195,
+    },
+    1: {
+        "name": "right-front",
+        "id": 1,
+        "coxia": 67.5,
+        "femur": -0.47331748411257024,
+        "tibia": -2.2161070165412298,
+    },
+    2: {
+        "name": "left-front",
+        "id": 2,
+        "coxia": 22.5,
+        "femur": -6.293985072629425,
+        "tibia": 16.10247333796029,
+    },
+    3: {
+        "name": "left-middle",
+        "id": 3,
+        "coxia": 0.0,
+        "femur": -8.85735968522819,
+        "tibia": 20.487315114722705,
+    },
+    4: {
+        "name": "left-back",
+        "id": 4,
+        "coxia": -22.5,
+        "femur": -6.293985072629425,
+        "tibia": 16.10247333796029,
+    },
+    5: {
+        "name": "right-back",
+        "id": 5,
+        "coxia": -67.5,
+        "femur": -0.47331748411257024,
+        "tibia": -2.2161070165412156,
+    },
+}
@@ -1,12 +1,15 @@
+import pytest
+import numpy as np
 from copy import deepcopy
 from hexapod.models import VirtualHexapod
 import hexapod.ik_solver.ik_solver2 as ik_solver2
 import hexapod.ik_solver.ik_solver as ik_solver
 
-from tests.ik_cases import case1, case2
+from tests.ik_cases import case1, case2, case3, case4
+from tests.ik_cases.alert_cases import CASES as ALERT_CASES
 from tests.helpers import assert_poses_equal, assert_two_hexapods_equal
 
-CASES = [case1, case2]
+CASES = [case1, case2, case3, case4]
 
 
 def assert_ik_solver(ik_function, case):
@@ -37,3 +40,46 @@ def test_points_ik2():
         hexapod_k.update(case.correct_poses)
 
         assert_two_hexapods_equal(hexapod_ik, hexapod_k, case.description)
+
+
+def assert_ik_alert(ik_function, case):
+    hexapod = VirtualHexapod(case["given_dimensions"])
+    with pytest.raises(Exception) as alert:
+        ik_function(hexapod, case["given_ik_parameters"])
+    assert str(alert.value) == case["correct_alert_msg"], case["description"]
+
+
+def test_ik_alerts():
+    for case in ALERT_CASES:
+        assert_ik_alert(ik_solver.inverse_kinematics_update, case)
+        assert_ik_alert(ik_solver2.inverse_kinematics_update, case)
+
+
+# The beta and gamma limits in settings can't be exceeded by any pose
+# so give might_raise_leg_alert() the statuses directly
+def test_beta_gamma_alert():
+    hexapod = VirtualHexapod(case1.given_dimensions)
+    stretched = np.zeros(6, dtype=bool)
+    statuses = np.full(6, ik_solver.LEG_OK)
+    statuses[1] = ik_solver.BETA_GAMMA_OUT_OF_RANGE
+    statuses[3] = ik_solver.ALPHA_OUT_OF_RANGE
+
+    angles = np.zeros((6, 3))
+    angles[1] = 0, 200, 0
+    angles[3] = 100, 0, 0
+    with pytest.raises(Exception) as alert:
+        ik_solver.might_raise_leg_alert(hexapod, angles, statuses, stretched)
+    assert str(alert.value) == (
+        "The (beta/femur) (of right-front leg) required\n"
+        "            to do this pose is beyond the range of motion.\n"
+        "            Required: 200.0 degrees. Limit: 180 degrees."
+    )
+
+    angles[1] = 0, 0, -190
+    with pytest.raises(Exception) as alert:
+        ik_solver.might_raise_leg_alert(hexapod, angles, statuses, stretched)
+    assert str(alert.value) == (
+        "The (gamma/tibia) (of right-front leg) required\n"
+        "            to do this pose is beyond the range of motion.\n"
+        "            Required: -190.0 degrees. Limit: 180 degrees."
+    )
@@ -0,0 +1,95 @@
+import numpy as np
+from copy import deepcopy
+from hexapod.models import VirtualHexapod
+from hexapod.points import Point, rotz
+import hexapod.ik_solver.ik_solver2 as ik_solver2
+import hexapod.ik_solver.ik_solver as ik_solver
+
+DIMENSIONS = {
+    "front": 60,
+    "side": 120,
+    "middle": 80,
+    "coxia": 80,
+    "femur": 60,
+    "tibia": 120,
+}
+
+# The right front leg can't reach its target ground contact
+# so it is stretched towards it and lifted off the ground
+IK_PARAMETERS = {
+    "hip_stance": 30,
+    "leg_stance": 45,
+    "percent_x": 0.25,
+    "percent_y": 0,
+    "percent_z": 0.5,
+    "rot_x": 10,
+    "rot_y": -10,
+    "rot_z": 0,
+}
+
+
+def leg_points_of(hexapod):
+    return [[(p.x, p.y, p.z) for p in leg.all_points] for leg in hexapod.legs]
+
+
+def test_leg_points_write_through():
+    hexapod = VirtualHexapod(DIMENSIONS)
+    leg = hexapod.legs[2]
+
+    leg.p3.z = -5
+    assert hexapod.leg_points[2, 3, 2] == -5
+
+    hexapod.leg_points[2, 1] = 1, 2, 3
+    assert leg.p1 == Point(1, 2, 3, name="left-front-coxia")
+    assert np.allclose(leg.points, hexapod.leg_points[2])
+
+
+def test_move_and_rotate_every_leg():
+    hexapod = VirtualHexapod(DIMENSIONS)
+    hexapod.update_stance(15, 30)
+    points = hexapod.leg_points.copy()
+
+    hexapod.move_xyz(1, 2, 3)
+    points += 1, 2, 3
+    assert np.allclose(hexapod.leg_points, points)
+    assert np.allclose(leg_points_of(hexapod), points)
+
+    frame = rotz(30)
+    expected = [
+        [leg_point.get_point_wrt(frame) for leg_point in leg.all_points]
+        for leg in hexapod.legs
+    ]
+    hexapod.rotate_and_shift(frame, 4)
+    for leg, expected_points in zip(hexapod.legs, expected):
+        for point, expected_point in zip(leg.all_points, expected_points):
+            expected_point.move_up(4)
+            assert np.isclose(point.x, expected_point.x)
+            assert np.isclose(point.y, expected_point.y)
+            assert np.isclose(point.z, expected_point.z)
+
+
+def test_deepcopy_shares_one_store():
+    hexapod = VirtualHexapod(DIMENSIONS)
+    points = hexapod.leg_points.copy()
+    hexapod_copy = deepcopy(hexapod)
+
+    hexapod_copy.move_xyz(1, 2, 3)
+    assert np.allclose(leg_points_of(hexapod_copy), points + (1, 2, 3))
+    assert np.allclose(hexapod_copy.leg_points, points + (1, 2, 3))
+
+    # The original is left alone
+    assert np.allclose(hexapod.leg_points, points)
+    assert np.allclose(leg_points_of(hexapod), points)
+
+
+def test_ground_contacts_stay_at_target_after_ik():
+    target = VirtualHexapod(DIMENSIONS)
+    target.update_stance(IK_PARAMETERS["hip_stance"], IK_PARAMETERS["leg_stance"])
+
+    for solver in [ik_solver, ik_solver2]:
+        hexapod = VirtualHexapod(DIMENSIONS)
+        solver.inverse_kinematics_update(hexapod, IK_PARAMETERS)
+
+        assert len(hexapod.ground_contacts) == len(target.ground_contacts)
+        for point, target_point in zip(hexapod.ground_contacts, target.ground_contacts):
+            assert point == target_point